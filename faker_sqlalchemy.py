@@ -37,10 +37,21 @@ Use ``instance`` as desired.
 >>> print(instance.value)
 RNvnAvOpyEVAoNGnVZQU
 
+Seeding From the Command Line
+-----------------------------
+
+Whole databases may be seeded with the ``faker-sqlalchemy`` command, which reports the progress and throughput of
+each table as it goes::
+
+    faker-sqlalchemy seed myapp.models:Base --url sqlite:///x.db --rows order=1e6 customer=1e4 --workers 4 --seed 42
+
+Run ``faker-sqlalchemy seed --help`` for all options.
+
 Supported Versions
 ------------------
 
-Currently SQLAlchemy versions 1.3 and 1.4 are supported. Support for SQLAlchemy 2.0 will be added when it is released.
+Currently SQLAlchemy versions 1.3, 1.4 and 2.0 are supported, including models declared with 2.0's ``DeclarativeBase``
+and ``MappedAsDataclass``.
 
 Faker versions ``>=8`` are currently supported, though it should be noted that the testing matrix isn't exhaustive. If
 bugs come up with a particular version of faker beyond version 8.0, submit a ticket to add support.
@@ -50,23 +61,68 @@ for Python 3.11 will be added when it is officially supported by SQLAlchemy. Cur
 releasing support for python 3.11.
 """
 
+import argparse
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import dataclasses
 import datetime
-from typing import Any, TypeVar, Type, Dict, Union, List, Callable
+from decimal import Decimal
+import importlib
+import json
+import math
+import os
+import random
+import sqlite3
+import string
+import sys
+import time
+from typing import (
+    Any,
+    TypeVar,
+    Type,
+    Dict,
+    Union,
+    List,
+    Callable,
+    Optional,
+    MutableSequence,
+    Iterable,
+    Iterator,
+    Tuple,
+    TextIO,
+    Set,
+)
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
 
 from faker import Faker
 from faker.providers import BaseProvider
 from faker.providers.date_time import Provider as DateTimeProvider
 from faker.providers.misc import Provider as MiscProvider
 from faker.providers.python import Provider as PythonProvider
-from sqlalchemy.orm import Mapper, RelationshipProperty
-try:
-    from sqlalchemy.orm import DeclarativeMeta
-except ImportError:
-    from sqlalchemy.ext.declarative import DeclarativeMeta
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Mapper, RelationshipProperty, Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import sort_tables
 from sqlalchemy.sql.type_api import TypeEngine
 from sqlalchemy import (
+    __version__ as _sqlalchemy_version,
+    create_engine,
+    and_,
+    func,
     inspect,
+    select,
     Column,
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    UniqueConstraint,
     ARRAY,
     BigInteger,
     BINARY,
@@ -91,6 +147,11 @@ from sqlalchemy import (
 __version__ = "0.10.2208140"
 __all__ = (
     "SqlAlchemyProvider",
+    "ColumnProfile",
+    "RowSet",
+    "TableProfile",
+    "TemplateDatabase",
+    "profile_table",
 )
 
 ModelType = TypeVar("ModelType")
@@ -100,6 +161,11 @@ GeneratorFunction = Callable[
     [Faker, Column], Column
 ]
 GeneratorSpec = Union[str, GeneratorFunction]
+SeedTarget = Union[Type[Any], Table]
+SeedProgress = Callable[[Table, int, int], None]
+BatchSource = Callable[[Table, List[Column], int, int], Iterable[List[Tuple[Any, ...]]]]
+
+_SQLALCHEMY_13 = _sqlalchemy_version.startswith("1.3.")
 
 
 def _generate_date(generator: DateTimeProvider, _: Any) -> datetime.date:
@@ -126,6 +192,59 @@ def _generate_small_bytes(generator: MiscProvider, _: Any) -> bytes:
     return generator.binary(100)
 
 
+def _select(*columns):
+    if _SQLALCHEMY_13:
+        return select(list(columns))
+    return select(*columns)
+
+
+def _table(target: SeedTarget) -> Table:
+    if isinstance(target, Table):
+        return target
+    return inspect(target).local_table
+
+
+def _python_type(column: Column):
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _encode_json(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, default=str)
+
+
+def _encode_binary(value: Any) -> Optional[str]:
+    return None if value is None else bytes(value).hex()
+
+
+def _csv_encoder(column: Column) -> Optional[Callable[[Any], Optional[str]]]:
+    if isinstance(column.type, JSON):
+        return _encode_json
+    if _python_type(column) is bytes:
+        return _encode_binary
+    return None
+
+
+def _supports_executemany_returning(connection: Connection) -> bool:
+    # SQLAlchemy 2.0 batches these statements with "insertmanyvalues".
+    return getattr(connection.dialect, "insert_executemany_returning", False)
+
+
+def _product(numbers: Iterable[int]) -> int:
+    result = 1
+    for number in numbers:
+        result *= number
+    return result
+
+
+def _key_array(column: Column) -> MutableSequence:
+    if _python_type(column) is int:
+        return array("q")
+    return []
+
+
 DEFAULT_MAPPINGS: Dict[TypeEngine, GeneratorSpec] = {
     BigInteger: "pyint",
     Boolean: "pybool",
@@ -145,6 +264,135 @@ DEFAULT_MAPPINGS: Dict[TypeEngine, GeneratorSpec] = {
 }
 
 
+class RowSet:
+    """Generated rows for a single table, stored as tuples.
+
+    Every row shares the same column index rather than carrying its own ``dict`` of
+    values or ORM instance state, which keeps the memory used by large numbers of
+    generated rows close to the size of the values themselves::
+
+        rows = fake.sqlalchemy_rows(SomeModel, 1000000)
+
+        rows.column("value")             # every generated value
+        rows[10][rows.index["value"]]    # the value of a single row
+        rows.insert(engine)
+    """
+    __slots__ = ("table", "columns", "index", "rows")
+
+    def __init__(self, table: Table, columns: List[str], rows: Optional[List[Tuple[Any, ...]]] = None):
+        """
+        :param table: The table the rows belong to.
+        :param columns: The keys of the columns, in the order of the values in each row.
+            A column's key is its name unless it was declared with a different ``key``.
+        :param rows: The rows to start with.
+        """
+        self.table = table
+        self.columns = columns
+        self.index = {key: position for position, key in enumerate(columns)}
+        self.rows = rows if rows is not None else []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return iter(self.rows)
+
+    def __getitem__(self, item: int) -> Tuple[Any, ...]:
+        return self.rows[item]
+
+    def append(self, row: Tuple[Any, ...]):
+        """Adds a row with a value for each of :attr:`columns`."""
+        self.rows.append(row)
+
+    def column(self, key: str) -> List[Any]:
+        """Returns the values of the column with ``key`` for every row."""
+        position = self.index[key]
+        return [row[position] for row in self.rows]
+
+    def as_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yields each row as a ``dict`` of values by column key."""
+        columns = self.columns
+        for row in self.rows:
+            yield dict(zip(columns, row))
+
+    def insert(self, bind: Union[Engine, Connection], batch_size=1000) -> int:
+        """Inserts the rows into :attr:`table` with Core ``INSERT`` statements.
+
+        Rows are converted to parameter dictionaries one batch at a time, so only
+        ``batch_size`` of them exist at once.
+
+        :param bind: The engine or connection to insert the rows with.
+        :param batch_size: The number of rows to insert per statement.
+        :return: Returns the number of rows inserted.
+        """
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                return self.insert(connection, batch_size)
+
+        statement = self.table.insert()
+        columns = self.columns
+        for start in range(0, len(self.rows), batch_size):
+            bind.execute(statement, [dict(zip(columns, row)) for row in self.rows[start:start + batch_size]])
+        return len(self.rows)
+
+    def insert_returning(self, bind: Union[Engine, Connection], columns: List[Column], batch_size=1000) -> "RowSet":
+        """Inserts the rows like :meth:`insert`, returning ``columns`` of the inserted rows.
+
+        Database assigned values such as autoincrementing primary keys are returned
+        with ``INSERT..RETURNING``. This requires a dialect that supports ``RETURNING``
+        for multiple rows, which SQLAlchemy 2.0 batches efficiently with its
+        "insertmanyvalues" feature.
+
+        :param bind: The engine or connection to insert the rows with.
+        :param columns: The columns to return.
+        :param batch_size: The number of rows to insert per statement.
+        :return: Returns a row set of the returned columns. The order of the rows is
+            not guaranteed to match the order they were inserted in.
+        """
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                return self.insert_returning(connection, columns, batch_size)
+
+        if not _supports_executemany_returning(bind):
+            raise ValueError(f"{bind.dialect.name} does not support RETURNING when inserting multiple rows")
+
+        statement = self.table.insert().returning(*columns)
+        keys = self.columns
+        returned = RowSet(self.table, [column.key for column in columns])
+        for start in range(0, len(self.rows), batch_size):
+            result = bind.execute(statement, [dict(zip(keys, row)) for row in self.rows[start:start + batch_size]])
+            returned.rows.extend(tuple(row) for row in result)
+        return returned
+
+    def to_csv(self, file: TextIO, header=True):
+        """Writes the rows to ``file`` as CSV.
+
+        Binary values are written as hexadecimal strings and JSON values as JSON
+        documents. ``None`` is written as an empty field.
+
+        :param file: A file opened in text mode, with ``newline=""``.
+        :param header: Write the column names as the first line.
+        """
+        columns = [self.table.columns[key] for key in self.columns]
+        encoders = [
+            (position, encoder)
+            for position, encoder in enumerate(_csv_encoder(column) for column in columns)
+            if encoder is not None
+        ]
+
+        writer = csv.writer(file)
+        if header:
+            writer.writerow([column.name for column in columns])
+        if not encoders:
+            writer.writerows(self.rows)
+            return
+        for row in self.rows:
+            row = list(row)
+            for position, encoder in encoders:
+                row[position] = encoder(row[position])
+            writer.writerow(row)
+
+
 class SqlAlchemyProvider(BaseProvider):
     """Generates instances of models declared with SQLAlchemy's ORM's declarative_base.
 
@@ -154,10 +402,17 @@ class SqlAlchemyProvider(BaseProvider):
     Methods:
 
     * :meth:`sqlalchemy_model`: Generates an instance of the given model.
+    * :meth:`sqlalchemy_rows`: Generates rows for a table without creating model instances.
+    * :meth:`sqlalchemy_seed`: Inserts generated rows into a database in bulk.
     * :meth:`register_type_mapping`: Tell providers which generator to use
       for ``type``.
+    * :meth:`register_column_mapping`: Tell providers which generator to use
+      for a specific column.
+    * :meth:`register_profile`: Generate values following the distributions
+      recorded by :func:`profile_table`.
     """
     MAPPINGS = DEFAULT_MAPPINGS.copy()
+    COLUMN_MAPPINGS: Dict[str, GeneratorSpec] = {}
 
     generator: BaseProvider
 
@@ -184,6 +439,33 @@ class SqlAlchemyProvider(BaseProvider):
         """Resets type mappings back to defaults."""
         cls.MAPPING = DEFAULT_MAPPINGS.copy()
 
+    @classmethod
+    def register_column_mapping(cls, column: str, spec: GeneratorSpec):
+        """Registers `spec` as a generator for a single column.
+
+        Column mappings take precedence over type mappings. `spec` may be any of the
+        values accepted by :meth:`register_type_mapping`.
+
+        :param column: The column that `spec` should apply to, as ``"table.column"``.
+        :param spec: The generator spec indicating how to generate the object.
+        """
+        cls.COLUMN_MAPPINGS[column] = spec
+
+    @classmethod
+    def register_profile(cls, profile: "TableProfile"):
+        """Registers the column distributions in `profile` as column mappings.
+
+        :param profile: A profile created by :func:`profile_table`, or loaded with
+            :meth:`TableProfile.load`.
+        """
+        for name, column_profile in profile.columns.items():
+            cls.register_column_mapping(f"{profile.table}.{name}", column_profile)
+
+    @classmethod
+    def reset_column_mappings(cls):
+        """Removes all column mappings."""
+        cls.COLUMN_MAPPINGS.clear()
+
     def sqlalchemy_model(
             self, model: Type[ModelType], generate_primary_keys=False, generate_related=False, **overrides
     ) -> ModelType:
@@ -205,7 +487,7 @@ class SqlAlchemyProvider(BaseProvider):
         :param overrides: Predetermined values to attach to the generated instance.
         :return: Returns a new instance of ``model``.
         """
-        assert isinstance(model, DeclarativeMeta)
+        assert isinstance(inspect(model, raiseerr=False), Mapper), f"{model} is not a mapped class"
         assert not (generate_primary_keys and generate_related), "`generate_primary_keys` and `generate_related` " \
                                                                  "MUST NOT both be set to True"
 
@@ -226,8 +508,81 @@ class SqlAlchemyProvider(BaseProvider):
                     relationship_property.mapper.class_, generate_primary_keys=generate_primary_keys, generate_related=True
                 )
 
+        if dataclasses.is_dataclass(model):
+            return self._construct_dataclass(model, values)
         return model(**values)
 
+    def sqlalchemy_rows(
+            self, target: SeedTarget, count: int, generate_primary_keys=False, **overrides
+    ) -> RowSet:
+        """Generate ``count`` rows for a model or ``Table`` as a :class:`RowSet`.
+
+        Values are generated the same way as :meth:`sqlalchemy_model` generates them,
+        but each row is stored as a tuple instead of an instance of the model. Primary
+        keys are not generated by default and foreign keys are only included if they
+        are given in ``overrides``.
+
+        :param target: The model or ``Table`` to generate rows for.
+        :param count: The number of rows to generate.
+        :param generate_primary_keys: Generate primary key fields.
+        :param overrides: Predetermined values to use for every row, keyed by column key.
+        :return: Returns the generated rows.
+        """
+        table = _table(target)
+        columns = [
+            column for column in table.columns
+            if column.key in overrides
+            or ((not column.primary_key or generate_primary_keys) and not column.foreign_keys)
+        ]
+
+        rows = RowSet(table, [column.key for column in columns])
+        for _ in range(count):
+            rows.append(tuple(
+                overrides[column.key] if column.key in overrides else self.sqlalchemy_column_value(column)
+                for column in columns
+            ))
+        return rows
+
+    def sqlalchemy_seed(
+            self, bind: Union[Engine, Connection], counts: Dict[SeedTarget, int], incremental=False, batch_size=1000,
+            progress: Optional[SeedProgress] = None,
+    ) -> Dict[str, int]:
+        """Insert generated rows for each model or table in ``counts``.
+
+        Rows are inserted with Core ``INSERT`` statements in batches of ``batch_size``
+        rather than going through the ORM. Tables are seeded in dependency order and
+        foreign keys are set by sampling the keys of rows that already exist in the
+        referenced table, including the rows inserted by this call.
+
+        Autoincrementing primary keys are left to the database, so sequences and identity
+        columns are never out of step with the table. When the dialect supports
+        ``RETURNING`` for multiple rows, as SQLAlchemy 2.0's "insertmanyvalues" does, the
+        keys that foreign keys need are read back from the ``INSERT``. Otherwise they are
+        read back from the rows with keys above the highest one seen so far. Integer
+        primary keys that don't autoincrement are assigned sequentially from the highest
+        key already in the table.
+
+        By default ``counts`` is the number of rows to add to each table. When
+        ``incremental`` is ``True``, ``counts`` is the number of rows each table should
+        end up with instead, and only the missing rows are generated.
+
+        :param bind: The engine or connection to insert the rows with.
+        :param counts: The number of rows to generate for each model or ``Table``.
+        :param incremental: Treat ``counts`` as target table sizes.
+        :param batch_size: The number of rows to insert per statement.
+        :param progress: Called with a table, the number of rows inserted into it so
+            far and the number being inserted, before the first batch and after each one.
+        :return: Returns the number of rows inserted into each table, by table name.
+        """
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                return self.sqlalchemy_seed(
+                    connection, counts, incremental=incremental, batch_size=batch_size, progress=progress
+                )
+
+        targets = {_table(target): count for target, count in counts.items()}
+        return _Seeder(self, bind, targets).run(targets, incremental, batch_size, progress)
+
     def sqlalchemy_column_value(self, column: Column) -> ColumnType:
         """Creates an instance of a type specified by ``column``.
 
@@ -242,7 +597,38 @@ class SqlAlchemyProvider(BaseProvider):
         else:
             return self._find_generator(generator_spec)()
 
+    @staticmethod
+    def _construct_dataclass(model: Type[ModelType], values: Dict[str, Any]) -> ModelType:
+        # Models mapped with ``MappedAsDataclass`` only accept their ``init`` fields,
+        # and require the ones without defaults. Collections are filled with an empty
+        # collection, everything else with ``None``.
+        relationships = inspect(model).relationships
+        arguments = {}
+        for field in dataclasses.fields(model):
+            if not field.init:
+                continue
+            if field.name in values:
+                arguments[field.name] = values.pop(field.name)
+            elif field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING:
+                relationship_property = relationships.get(field.name)
+                if relationship_property is not None and relationship_property.uselist:
+                    arguments[field.name] = (relationship_property.collection_class or list)()
+                else:
+                    arguments[field.name] = None
+
+        instance = model(**arguments)
+        for key, value in values.items():
+            setattr(instance, key, value)
+        return instance
+
     def _find_generator_spec(self, column: Column):
+        if self.COLUMN_MAPPINGS:
+            table = getattr(column, "table", None)
+            if table is not None:
+                spec = self.COLUMN_MAPPINGS.get(f"{table.name}.{column.name}")
+                if spec is not None:
+                    return spec
+
         if type(column.type) in self.MAPPINGS:
             return self.MAPPINGS[type(column.type)]
         else:
@@ -256,3 +642,930 @@ class SqlAlchemyProvider(BaseProvider):
             return getattr(self.generator, generator_spec)
         else:
             return getattr(self, generator_spec)
+
+
+class _Seeder:
+    """Inserts generated rows and keeps track of the keys foreign keys may refer to.
+
+    Referenced keys are loaded once per table as compact arrays, one per column, rather
+    than as ORM objects, and are extended as new rows are inserted.
+    """
+
+    def __init__(
+            self, provider: SqlAlchemyProvider, connection: Connection, tables: Iterable[Table],
+            batches: Optional[BatchSource] = None,
+    ):
+        self._provider = provider
+        self._connection = connection
+        self._random = provider.generator.random
+        self._batches = batches or self._generate_batches
+
+        # The groups of columns foreign keys refer to, by table. Each group's keys are
+        # stored as one array per column, aligned by row.
+        self._referenced: Dict[Table, List[Tuple[Column, ...]]] = {}
+        for table in tables:
+            for constraint in table.foreign_key_constraints:
+                groups = self._referenced.setdefault(constraint.referred_table, [])
+                group = self._referenced_columns(constraint)
+                if group not in groups:
+                    groups.append(group)
+        self._keys: Dict[Tuple[Column, ...], List[MutableSequence]] = {}
+        self._loaded: Set[Table] = set()
+
+    def run(
+            self, counts: Dict[Table, int], incremental: bool, batch_size: int, progress: Optional[SeedProgress]
+    ) -> Dict[str, int]:
+        inserted = {}
+        for table in sort_tables(counts):
+            count = counts[table]
+            if incremental:
+                count = max(count - self.row_count(table), 0)
+            inserted[table.name] = self.seed(table, count, batch_size, progress)
+        return inserted
+
+    def row_count(self, table: Table) -> int:
+        return self._connection.execute(_select(func.count()).select_from(table)).scalar()
+
+    def seed(self, table: Table, count: int, batch_size: int, progress: Optional[SeedProgress] = None) -> int:
+        key_column = self._integer_primary_key(table)
+        # Autoincrementing keys are left to the database so that sequences and identity
+        # columns stay in step with the table.
+        database_keys = key_column is not None and key_column.autoincrement in (True, "auto")
+        returning = database_keys and _supports_executemany_returning(self._connection)
+        next_key = 1
+        if key_column is not None and not database_keys:
+            next_key = self._max_key(key_column) + 1
+
+        constraints = list(table.foreign_key_constraints)
+        for constraint in constraints:
+            self._load_keys(constraint.referred_table)
+        if table in self._referenced:
+            self._load_keys(table)
+
+        # Without RETURNING, the keys the database assigned are read back from the rows
+        # with keys above the highest one seen so far.
+        watermark = None
+        if database_keys and not returning and table in self._loaded:
+            watermark = self._max_key(key_column)
+
+        columns = [column for column in table.columns if not (database_keys and column is key_column)]
+        keys = [column.key for column in columns]
+        foreign_key_columns = {element.parent for constraint in constraints for element in constraint.elements}
+        generated_positions, generated_columns = [], []
+        for position, column in enumerate(columns):
+            if column is not key_column and column not in foreign_key_columns:
+                generated_positions.append(position)
+                generated_columns.append(column)
+        key_position = keys.index(key_column.key) if key_column is not None and not database_keys else None
+
+        # Foreign keys that make up a primary key or unique constraint, as in association
+        # tables, are drawn together without replacement. The rest are drawn at random.
+        unique_sets = self._unique_foreign_key_sets(table, foreign_key_columns)
+        unique_constraints = [
+            constraint for constraint in constraints
+            if any(element.parent in unique_set for unique_set in unique_sets for element in constraint.elements)
+        ]
+        unique_keys = self._unique_keys(table, unique_constraints, unique_sets, count) if unique_sets else None
+        if unique_keys is None:
+            unique_constraints = []
+        foreign_key_positions = [
+            (constraint, [keys.index(element.parent.key) for element in constraint.elements])
+            for constraint in constraints if constraint not in unique_constraints
+        ]
+        unique_key_positions = [
+            [keys.index(element.parent.key) for element in constraint.elements] for constraint in unique_constraints
+        ]
+
+        inserted = 0
+        if progress is not None:
+            progress(table, inserted, count)
+        for batch in self._batches(table, generated_columns, count, batch_size):
+            rows = RowSet(table, keys)
+            for values in batch:
+                row = [None] * len(keys)
+                for position, value in zip(generated_positions, values):
+                    row[position] = value
+                if key_position is not None:
+                    row[key_position] = next_key
+                    next_key += 1
+                for constraint, positions in foreign_key_positions:
+                    for position, value in zip(positions, self._sample_keys(table, constraint)):
+                        row[position] = value
+                if unique_keys is not None:
+                    for positions, unique_values in zip(unique_key_positions, next(unique_keys)):
+                        for position, value in zip(positions, unique_values):
+                            row[position] = value
+                rows.append(tuple(row))
+
+            if returning and table in self._loaded:
+                returned = rows.insert_returning(self._connection, self._referenced_table_columns(table), batch_size)
+                self._add_keys(returned)
+            elif watermark is not None:
+                rows.insert(self._connection, batch_size)
+                watermark = self._load_new_keys(table, key_column, watermark)
+            else:
+                rows.insert(self._connection, batch_size)
+                self._add_keys(rows)
+
+            inserted += len(rows)
+            if progress is not None:
+                progress(table, inserted, count)
+
+        return inserted
+
+    def _generate_batches(
+            self, table: Table, columns: List[Column], count: int, batch_size: int
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        generate = self._provider.sqlalchemy_column_value
+        for start in range(0, count, batch_size):
+            yield [tuple(generate(column) for column in columns) for _ in range(min(batch_size, count - start))]
+
+    @staticmethod
+    def _integer_primary_key(table: Table) -> Optional[Column]:
+        columns = list(table.primary_key.columns)
+        if len(columns) == 1 and not columns[0].foreign_keys and _python_type(columns[0]) is int:
+            return columns[0]
+        return None
+
+    @staticmethod
+    def _referenced_columns(constraint: ForeignKeyConstraint) -> Tuple[Column, ...]:
+        return tuple(element.column for element in constraint.elements)
+
+    def _load_keys(self, table: Table):
+        if table in self._loaded:
+            return
+
+        self._loaded.add(table)
+        for group in self._referenced[table]:
+            self._keys[group] = [_key_array(column) for column in group]
+            statement = _select(*group).where(and_(*(column.isnot(None) for column in group)))
+            self._extend_keys(group, self._connection.execute(statement))
+
+    def _load_new_keys(self, table: Table, key_column: Column, watermark: int) -> int:
+        columns = [key_column]
+        columns.extend(column for column in self._referenced_table_columns(table) if column is not key_column)
+        result = self._connection.execute(_select(*columns).where(key_column > watermark))
+        rows = RowSet(table, [column.key for column in columns], [tuple(row) for row in result])
+        self._add_keys(rows)
+        return max(rows.column(key_column.key), default=watermark)
+
+    def _max_key(self, key_column: Column) -> int:
+        return self._connection.execute(_select(func.max(key_column))).scalar() or 0
+
+    def _referenced_table_columns(self, table: Table) -> List[Column]:
+        columns = []
+        for group in self._referenced[table]:
+            columns.extend(column for column in group if column not in columns)
+        return columns
+
+    def _add_keys(self, rows: "RowSet"):
+        if rows.table not in self._loaded:
+            return
+
+        for group in self._referenced[rows.table]:
+            positions = [rows.index[column.key] for column in group]
+            self._extend_keys(group, (tuple(row[position] for position in positions) for row in rows))
+
+    def _extend_keys(self, group: Tuple[Column, ...], rows: Iterable[Tuple[Any, ...]]):
+        keys = self._keys[group]
+        for row in rows:
+            # Rows with null keys can't be referenced.
+            if any(value is None for value in row):
+                continue
+            for values, value in zip(keys, row):
+                values.append(value)
+
+    @staticmethod
+    def _unique_foreign_key_sets(table: Table, foreign_key_columns: Set[Column]) -> List[Tuple[Column, ...]]:
+        candidates = [tuple(table.primary_key.columns)]
+        candidates.extend(
+            tuple(constraint.columns) for constraint in table.constraints if isinstance(constraint, UniqueConstraint)
+        )
+        candidates.extend(tuple(index.columns) for index in table.indexes if index.unique)
+        candidates.extend((column,) for column in table.columns if column.unique)
+
+        unique_sets = []
+        for candidate in candidates:
+            if candidate and all(column in foreign_key_columns for column in candidate):
+                if not any(set(candidate) == set(unique_set) for unique_set in unique_sets):
+                    unique_sets.append(candidate)
+        return unique_sets
+
+    def _unique_keys(
+            self, table: Table, constraints: List[ForeignKeyConstraint], unique_sets: List[Tuple[Column, ...]],
+            count: int,
+    ) -> Optional[Iterator[List[List[Any]]]]:
+        pools = [self._keys[self._referenced_columns(constraint)] for constraint in constraints]
+        sizes = [len(pool[0]) for pool in pools]
+        if 0 in sizes:
+            # Nothing to draw from, leave it to ``_sample_keys`` to use nulls or fail.
+            return None
+
+        # Where each column of a unique set comes from, as (constraint, element) positions.
+        locations = {}
+        for constraint_index, constraint in enumerate(constraints):
+            for element_index, element in enumerate(constraint.elements):
+                locations[element.parent] = (constraint_index, element_index)
+        projections = [[locations[column] for column in unique_set] for unique_set in unique_sets]
+
+        used = []
+        for unique_set in unique_sets:
+            statement = _select(*unique_set).where(and_(*(column.isnot(None) for column in unique_set)))
+            used.append({tuple(row) for row in self._connection.execute(statement)})
+
+        available = min(
+            _product(sizes[index] for index in {index for index, _ in projection}) - len(values)
+            for projection, values in zip(projections, used)
+        )
+        if count > available:
+            names = ", ".join(constraint.referred_table.name for constraint in constraints)
+            raise ValueError(
+                f"Unable to generate {count} rows for {table.name}: the rows in {names} only allow "
+                f"{max(available, 0)} more unique combinations of keys"
+            )
+
+        return self._draw_unique_keys(table, pools, sizes, projections, used, count)
+
+    def _draw_unique_keys(
+            self, table: Table, pools: List[List[MutableSequence]], sizes: List[int],
+            projections: List[List[Tuple[int, int]]], used: List[Set[Tuple[Any, ...]]], count: int,
+    ) -> Iterator[List[List[Any]]]:
+        # Combinations of keys are numbered in mixed radix, one digit per constraint. When
+        # most of them are needed they are shuffled and taken in turn, otherwise they are
+        # drawn at random and rejected if already used.
+        total = _product(sizes)
+        if 2 * (count + max(len(values) for values in used)) >= total:
+            shuffled = list(range(total))
+            self._random.shuffle(shuffled)
+            combinations = iter(shuffled)
+        else:
+            combinations = (self._random.randrange(total) for _ in range(100 * count + 1000))
+
+        produced = 0
+        for combination in combinations:
+            if produced == count:
+                return
+
+            indexes = []
+            for size in sizes:
+                combination, index = divmod(combination, size)
+                indexes.append(index)
+
+            keys = [[values[index] for values in pool] for pool, index in zip(pools, indexes)]
+            projected = [
+                tuple(keys[constraint_index][element_index] for constraint_index, element_index in projection)
+                for projection in projections
+            ]
+            if any(value in values for value, values in zip(projected, used)):
+                continue
+
+            for value, values in zip(projected, used):
+                values.add(value)
+            produced += 1
+            yield keys
+
+        if produced < count:
+            raise ValueError(
+                f"Unable to generate {count} rows for {table.name}: ran out of unique combinations of keys"
+            )
+
+    def _sample_keys(self, table: Table, constraint: ForeignKeyConstraint) -> List[Any]:
+        keys = self._keys[self._referenced_columns(constraint)]
+        size = len(keys[0])
+        if size == 0:
+            if all(element.parent.nullable for element in constraint.elements):
+                return [None] * len(constraint.elements)
+            raise ValueError(
+                f"Unable to generate rows for {table.name}: {constraint.referred_table.name} has no rows to reference"
+            )
+
+        index = self._random.randrange(size)
+        return [values[index] for values in keys]
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_STRING_CHARACTERS = string.ascii_letters
+# The most values a profile keeps for repeating them.
+_PROFILE_POOL_SIZE = 100000
+
+
+class _AliasTable:
+    """Samples indexes in proportion to ``weights`` in constant time (Vose's alias method)."""
+
+    def __init__(self, weights: List[float]):
+        size = len(weights)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+
+        self._probabilities = [1.0] * size
+        self._aliases = list(range(size))
+
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probabilities[less] = scaled[less]
+            self._aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def sample(self, rng: random.Random) -> int:
+        index = rng.randrange(len(self._probabilities))
+        if rng.random() < self._probabilities[index]:
+            return index
+        return self._aliases[index]
+
+
+class ColumnProfile:
+    """The distribution of the values observed in a column.
+
+    Profiles are created by :func:`profile_table`. The ``kind`` of a profile
+    determines what ``values`` holds and how ``weights`` are used:
+
+    * ``"categorical"``: ``values`` are the distinct values observed and ``weights``
+      how often each one occurred.
+    * ``"integer"``, ``"float"``, ``"date"`` and ``"datetime"``: ``values`` are the
+      edges of a histogram and ``weights`` the number of values in each bin. Dates
+      are stored as ordinals and datetimes as seconds since the epoch.
+    * ``"string"``: ``values`` are the string lengths observed and ``weights`` how
+      often each length occurred.
+    * ``"null"``: the column only contained nulls.
+
+    ``distinct`` is the number of distinct values observed. When fewer values were
+    distinct than were sampled, generated values are drawn from a pool that grows at
+    the same rate, so the generated column has the same ratio of distinct values.
+
+    Profiles are generator specs, so they may be registered with
+    :meth:`SqlAlchemyProvider.register_column_mapping`.
+    """
+
+    def __init__(self, kind: str, null_rate: float, distinct: int, values: List[Any], weights: List[float]):
+        self.kind = kind
+        self.null_rate = null_rate
+        self.distinct = distinct
+        self.values = values
+        self.weights = weights
+        self._alias_table = _AliasTable(weights) if weights else None
+        # Categorical values already repeat at the observed rate.
+        total = sum(weights)
+        self._distinct_rate = distinct / total if kind != "categorical" and 0 < distinct < total else 1.0
+        self._pool: List[Any] = []
+
+    def __call__(self, generator: Faker, _: Any) -> Any:
+        rng = generator.random
+        if self._alias_table is None or rng.random() < self.null_rate:
+            return None
+        if self._distinct_rate == 1.0:
+            return self._generate(rng)
+
+        pool = self._pool
+        if pool and rng.random() >= self._distinct_rate:
+            return pool[rng.randrange(len(pool))]
+        value = self._generate(rng)
+        if len(pool) < _PROFILE_POOL_SIZE:
+            pool.append(value)
+        else:
+            pool[rng.randrange(_PROFILE_POOL_SIZE)] = value
+        return value
+
+    def _generate(self, rng: random.Random) -> Any:
+        index = self._alias_table.sample(rng)
+        if self.kind == "categorical":
+            return self.values[index]
+        elif self.kind == "string":
+            return "".join(rng.choices(_STRING_CHARACTERS, k=self.values[index]))
+
+        low, high = self.values[index], self.values[index + 1]
+        if self.kind == "float":
+            return rng.uniform(low, high)
+        elif self.kind == "datetime":
+            return _EPOCH + datetime.timedelta(seconds=rng.uniform(low, high))
+
+        value = rng.randint(math.ceil(low), max(math.ceil(low), math.floor(high)))
+        if self.kind == "date":
+            return datetime.date.fromordinal(value)
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the profile as JSON serializable data."""
+        return {
+            "kind": self.kind,
+            "null_rate": self.null_rate,
+            "distinct": self.distinct,
+            "values": self.values,
+            "weights": self.weights,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnProfile":
+        """Creates a profile from data returned by :meth:`to_dict`."""
+        return cls(data["kind"], data["null_rate"], data["distinct"], data["values"], data["weights"])
+
+    @classmethod
+    def from_values(cls, values: List[Any], bins=20, max_categories=100) -> "ColumnProfile":
+        """Creates a profile from a sample of the values in a column.
+
+        :param values: The sampled values, including nulls.
+        :param bins: The number of bins in numeric and temporal histograms.
+        :param max_categories: Columns with at most this many distinct values are
+            profiled as categorical.
+        :return: Returns the profile, or ``None`` if the values can't be profiled.
+        """
+        present = [value for value in values if value is not None]
+        if not present:
+            return cls("null", 1.0, 0, [], [])
+
+        sample = present[0]
+        if not isinstance(sample, (bool, int, float, Decimal, str, datetime.date)):
+            return None
+
+        null_rate = 1 - len(present) / len(values)
+        counts = Counter(present)
+        if isinstance(sample, (bool, int, float, str)) and len(counts) <= max_categories:
+            categories = sorted(counts, key=lambda value: -counts[value])
+            return cls("categorical", null_rate, len(counts), categories, [counts[value] for value in categories])
+        elif isinstance(sample, str):
+            lengths = Counter(len(value) for value in present)
+            sizes = sorted(lengths)
+            return cls("string", null_rate, len(counts), sizes, [lengths[size] for size in sizes])
+        elif isinstance(sample, datetime.datetime):
+            kind = "datetime"
+            numbers = [(value.replace(tzinfo=None) - _EPOCH).total_seconds() for value in present]
+        elif isinstance(sample, datetime.date):
+            kind = "date"
+            numbers = [value.toordinal() for value in present]
+        elif isinstance(sample, int):
+            kind = "integer"
+            numbers = present
+        else:
+            kind = "float"
+            numbers = [float(value) for value in present]
+
+        low, high = min(numbers), max(numbers)
+        if low == high:
+            return cls(kind, null_rate, len(counts), [low, high], [len(numbers)])
+
+        width = (high - low) / bins
+        edges = [low + width * index for index in range(bins)] + [high]
+        weights = [0] * bins
+        for number in numbers:
+            weights[min(int((number - low) / width), bins - 1)] += 1
+        return cls(kind, null_rate, len(counts), edges, weights)
+
+
+class TableProfile:
+    """The column distributions of a table, as recorded by :func:`profile_table`.
+
+    Profiles may be saved to and loaded from a compact JSON file, and registered
+    with :meth:`SqlAlchemyProvider.register_profile`.
+    """
+
+    def __init__(self, table: str, rows: int, columns: Dict[str, ColumnProfile]):
+        self.table = table
+        self.rows = rows
+        self.columns = columns
+
+    def save(self, path: str):
+        """Writes the profile to ``path``."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "TableProfile":
+        """Reads a profile written by :meth:`save`."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the profile as JSON serializable data."""
+        return {
+            "table": self.table,
+            "rows": self.rows,
+            "columns": {name: column.to_dict() for name, column in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TableProfile":
+        """Creates a profile from data returned by :meth:`to_dict`."""
+        return cls(
+            data["table"],
+            data["rows"],
+            {name: ColumnProfile.from_dict(column) for name, column in data["columns"].items()},
+        )
+
+
+def profile_table(
+        bind: Union[Engine, Connection], target: SeedTarget, sample_size=10000, bins=20, max_categories=100,
+        seed: Optional[int] = None,
+) -> TableProfile:
+    """Records the distribution of the values in each column of a table.
+
+    The table is streamed and a uniform sample of at most ``sample_size`` rows is kept
+    with reservoir sampling, so memory use doesn't depend on the size of the table.
+    Null rates, distinct counts and histograms are computed from that sample.
+
+    Primary and foreign key columns are not profiled since :meth:`SqlAlchemyProvider.sqlalchemy_seed`
+    assigns them itself. Columns with values that can't be profiled, such as JSON or
+    binary columns, are left to the type mappings.
+
+    :param bind: The engine or connection to read the table with.
+    :param target: The model or ``Table`` to profile.
+    :param sample_size: The maximum number of rows to profile.
+    :param bins: The number of bins in numeric and temporal histograms.
+    :param max_categories: Columns with at most this many distinct values are
+        profiled as categorical.
+    :param seed: Seeds the choice of sampled rows.
+    :return: Returns the profile of the table.
+    """
+    if isinstance(bind, Engine):
+        with bind.connect() as connection:
+            return profile_table(connection, target, sample_size, bins, max_categories, seed)
+
+    table = _table(target)
+    columns = [column for column in table.columns if not column.primary_key and not column.foreign_keys]
+    rng = random.Random(seed)
+
+    sample = []
+    seen = 0
+    result = bind.execution_options(stream_results=True).execute(_select(*columns))
+    try:
+        rows = result.fetchmany(1000)
+        while rows:
+            for row in rows:
+                seen += 1
+                if len(sample) < sample_size:
+                    sample.append(tuple(row))
+                else:
+                    index = rng.randrange(seen)
+                    if index < sample_size:
+                        sample[index] = tuple(row)
+            rows = result.fetchmany(1000)
+    finally:
+        result.close()
+
+    profiles = {}
+    for position, column in enumerate(columns):
+        profile = ColumnProfile.from_values([row[position] for row in sample], bins, max_categories)
+        if profile is not None:
+            profiles[column.name] = profile
+    return TableProfile(table.name, seen, profiles)
+
+
+def _sqlite_engine(connection: sqlite3.Connection) -> Engine:
+    return create_engine("sqlite://", creator=lambda: connection, poolclass=StaticPool)
+
+
+class TemplateDatabase:
+    """A SQLite database that is seeded once and then copied for each test.
+
+    Populating a database with generated models for every test gets expensive as the
+    dataset grows. A ``TemplateDatabase`` creates the tables in ``metadata`` and runs
+    ``populate`` only once, the first time a copy is requested. Each call to
+    :meth:`clone` then copies the seeded database with SQLite's backup API, so the
+    per-test cost doesn't depend on how the data was generated.
+
+    ``populate`` is called with a ``Session`` which is committed afterwards::
+
+        template = TemplateDatabase(
+            Base.metadata,
+            lambda session: session.add_all(fake.sqlalchemy_model(SomeModel) for _ in range(10000)),
+        )
+
+        engine = template.clone()
+
+    Methods:
+
+    * :meth:`clone`: Creates a new engine bound to a copy of the template.
+    * :meth:`close`: Releases the template database.
+    """
+
+    def __init__(self, metadata: MetaData, populate: Optional[Callable[[Session], None]] = None):
+        """
+        :param metadata: The metadata describing the tables to create.
+        :param populate: Called with a session to seed the template database.
+        """
+        self.metadata = metadata
+        self._populate = populate
+        self._connection: Optional[sqlite3.Connection] = None
+        self._engine: Optional[Engine] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def clone(self, path: Optional[str] = None) -> Engine:
+        """Creates an engine bound to a fresh copy of the template database.
+
+        Changes made through the returned engine never affect the template, or any
+        other copy. Call ``dispose()`` on the engine to release the copy.
+
+        :param path: A file to write the copy to. The copy is kept in memory by default.
+        :return: Returns an ``Engine`` bound to the copy.
+        """
+        template = self._template()
+        connection = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        template.backup(connection)
+        return _sqlite_engine(connection)
+
+    def close(self):
+        """Releases the template database. It will be seeded again if cloned afterwards."""
+        if self._engine is not None:
+            self._engine.dispose()
+            # SQLAlchemy 1.3's static pool doesn't close the connection it was given.
+            self._connection.close()
+        self._engine = None
+        self._connection = None
+
+    def _template(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            engine = _sqlite_engine(connection)
+            try:
+                self.metadata.create_all(engine)
+
+                if self._populate is not None:
+                    session = Session(bind=engine)
+                    try:
+                        self._populate(session)
+                        session.commit()
+                    finally:
+                        session.close()
+            except BaseException:
+                engine.dispose()
+                connection.close()
+                raise
+
+            self._engine = engine
+            self._connection = connection
+        return self._connection
+
+
+def _load_metadata(target: str) -> MetaData:
+    module_name, _, attribute = target.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Expected a target like 'module:Base', got {target!r}")
+
+    value = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        value = getattr(value, name)
+
+    metadata = value if isinstance(value, MetaData) else getattr(value, "metadata", None)
+    if not isinstance(metadata, MetaData):
+        raise ValueError(f"{target} is neither a MetaData nor a declarative base")
+    return metadata
+
+
+_worker_metadata: Optional[MetaData] = None
+_worker_provider: Optional[SqlAlchemyProvider] = None
+
+
+def _initialize_worker(target: str):
+    global _worker_metadata, _worker_provider
+    _worker_metadata = _load_metadata(target)
+    _worker_provider = SqlAlchemyProvider(Faker())
+
+
+def _generate_worker_batch(
+        table_key: str, column_keys: List[str], count: int, seed: Optional[str]
+) -> Tuple[int, Optional[int], List[Tuple[Any, ...]]]:
+    if seed is not None:
+        _worker_provider.generator.seed_instance(seed)
+    table = _worker_metadata.tables[table_key]
+    columns = [table.columns[key] for key in column_keys]
+    generate = _worker_provider.sqlalchemy_column_value
+    rows = [tuple(generate(column) for column in columns) for _ in range(count)]
+    # Workers report their own peak memory, since ``RUSAGE_CHILDREN`` only covers
+    # children that have already exited.
+    return os.getpid(), _process_peak_memory(), rows
+
+
+def _process_peak_memory() -> Optional[int]:
+    """Returns the peak resident memory of the current process in bytes."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ``ru_maxrss`` is in bytes on macOS and kilobytes everywhere else.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _peak_memory(worker_peaks: Dict[int, int]) -> Optional[int]:
+    """Returns the sum of the peak resident memory of this process and each worker in bytes."""
+    peak = _process_peak_memory()
+    if peak is None:
+        return None
+    return peak + sum(worker_peaks.values())
+
+
+def _format_memory(size: Optional[int]) -> str:
+    return "n/a" if size is None else f"{size / 2 ** 20:,.1f} MB"
+
+
+class _Progress:
+    """Reports the progress of a seeding run, table by table."""
+
+    def __init__(self, stream: TextIO, worker_peaks: Dict[int, int], interval=0.5):
+        self._stream = stream
+        self._worker_peaks = worker_peaks
+        self._interval = interval
+        self._live = stream.isatty()
+        self._started = time.perf_counter()
+        self._table_started = self._started
+        self._last_report = 0.0
+        self.tables: List[Tuple[str, int, float]] = []
+
+    def __call__(self, table: Table, inserted: int, total: int):
+        now = time.perf_counter()
+        if inserted == 0:
+            self._table_started = now
+
+        if inserted == total:
+            elapsed = now - self._table_started
+            self.tables.append((table.name, total, elapsed))
+            self._report(table, inserted, total, elapsed, end="\n")
+        elif self._live and now - self._last_report >= self._interval:
+            self._last_report = now
+            self._report(table, inserted, total, now - self._table_started, end="")
+
+    def _report(self, table: Table, inserted: int, total: int, elapsed: float, end: str):
+        percent = 100 * inserted // total if total else 100
+        rate = inserted / elapsed if elapsed else 0
+        line = (
+            f"{table.name}: {inserted:,}/{total:,} rows ({percent}%), {rate:,.0f} rows/s, "
+            f"peak memory {_format_memory(_peak_memory(self._worker_peaks))}"
+        )
+        if self._live:
+            line = "\r\033[K" + line
+        print(line, end=end, file=self._stream, flush=True)
+
+    def summary(self, stream: TextIO):
+        elapsed = time.perf_counter() - self._started
+        total = sum(rows for _, rows, _ in self.tables)
+        width = max([len(name) for name, _, _ in self.tables] + [len("total")])
+
+        print(f"{'table':<{width}} {'rows':>12} {'seconds':>10} {'rows/s':>12}", file=stream)
+        for name, rows, seconds in self.tables + [("total", total, elapsed)]:
+            rate = rows / seconds if seconds else 0
+            print(f"{name:<{width}} {rows:>12,} {seconds:>10.2f} {rate:>12,.0f}", file=stream)
+        print(f"peak memory: {_format_memory(_peak_memory(self._worker_peaks))}", file=stream)
+
+
+def _worker_batches(
+        executor: ProcessPoolExecutor, workers: int, seed: Optional[int], worker_peaks: Dict[int, int]
+) -> BatchSource:
+    def result(future) -> List[Tuple[Any, ...]]:
+        pid, peak, rows = future.result()
+        if peak is not None:
+            worker_peaks[pid] = max(peak, worker_peaks.get(pid, 0))
+        return rows
+
+    def batches(table: Table, columns: List[Column], count: int, batch_size: int):
+        column_keys = [column.key for column in columns]
+        tasks = (
+            (
+                table.key,
+                column_keys,
+                min(batch_size, count - start),
+                None if seed is None else f"{seed}:{table.key}:{start}",
+            )
+            for start in range(0, count, batch_size)
+        )
+
+        # Keep a few batches in flight per worker without generating far ahead of
+        # the inserts, which would hold every generated row in memory.
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_generate_worker_batch, *task))
+            if len(pending) >= 2 * workers:
+                yield result(pending.popleft())
+        while pending:
+            yield result(pending.popleft())
+
+    return batches
+
+
+def _row_count(value: str) -> Tuple[str, int]:
+    table, separator, count = value.partition("=")
+    try:
+        rows = int(float(count))
+    except (ValueError, OverflowError):
+        rows = -1
+    if not separator or not table or rows < 0:
+        raise argparse.ArgumentTypeError(f"expected TABLE=COUNT, got {value!r}")
+    return table, rows
+
+
+def _positive_integer(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def _seed_command(parser: argparse.ArgumentParser, arguments: argparse.Namespace) -> int:
+    # Allow targets in the working directory, as ``python -m`` would.
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    try:
+        metadata = _load_metadata(arguments.target)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+
+    counts = {}
+    for name, count in [row for rows in arguments.rows for row in rows]:
+        if name not in metadata.tables:
+            parser.error(f"unknown table {name!r}, expected one of: {', '.join(sorted(metadata.tables))}")
+        counts[metadata.tables[name]] = count
+
+    faker = Faker()
+    if arguments.seed is not None:
+        faker.seed_instance(arguments.seed)
+
+    try:
+        engine = create_engine(arguments.url)
+    except (ImportError, SQLAlchemyError) as e:
+        parser.error(str(e))
+
+    worker_peaks = {}
+    progress = _Progress(sys.stderr, worker_peaks)
+    executor = None
+    try:
+        if arguments.create_tables:
+            metadata.create_all(engine)
+
+        batches = None
+        if arguments.workers > 1:
+            executor = ProcessPoolExecutor(
+                arguments.workers, initializer=_initialize_worker, initargs=(arguments.target,)
+            )
+            batches = _worker_batches(executor, arguments.workers, arguments.seed, worker_peaks)
+
+        with engine.begin() as connection:
+            _Seeder(SqlAlchemyProvider(faker), connection, counts, batches).run(
+                counts, arguments.incremental, arguments.batch_size, progress
+            )
+    except (ValueError, SQLAlchemyError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        engine.dispose()
+
+    progress.summary(sys.stdout)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the ``faker-sqlalchemy`` command line tool.
+
+    The ``seed`` command inserts generated rows into the tables of a declarative base,
+    reporting the progress and throughput of each table as it goes::
+
+        faker-sqlalchemy seed myapp.models:Base --url sqlite:///x.db --rows order=1e6 --workers 4 --seed 42
+
+    Type mappings registered when the module is imported are used for every worker.
+
+    :param argv: The command line arguments, ``sys.argv[1:]`` by default.
+    :return: Returns the exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="faker-sqlalchemy", description="Generate data for SQLAlchemy models with Faker."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    seed = commands.add_parser("seed", help="Insert generated rows into a database.")
+    seed.add_argument("target", help="The declarative base or MetaData to seed, as 'module:Base'.")
+    seed.add_argument("--url", required=True, help="The database URL to insert rows into.")
+    seed.add_argument(
+        "--rows", required=True, type=_row_count, nargs="+", action="append", metavar="TABLE=COUNT",
+        help="The number of rows to insert into each table, e.g. 'order=1e6'.",
+    )
+    seed.add_argument(
+        "--incremental", action="store_true",
+        help="Treat row counts as target table sizes and only insert the missing rows.",
+    )
+    seed.add_argument(
+        "--workers", type=_positive_integer, default=1, help="The number of processes generating rows."
+    )
+    seed.add_argument("--seed", type=int, help="Seeds the generated data.")
+    seed.add_argument(
+        "--batch-size", type=_positive_integer, default=1000, help="The number of rows to insert per statement."
+    )
+    seed.add_argument("--create-tables", action="store_true", help="Create missing tables before seeding.")
+
+    arguments = parser.parse_args(argv)
+    return _seed_command(seed, arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,12 @@
+import csv
 import datetime
+import io
+import json
 import os.path
+import re
+import sqlite3
 import unittest
+from unittest import mock
 import tempfile
 from typing import Union, ClassVar
 import warnings
@@ -9,10 +15,21 @@ from faker import Faker
 from sqlalchemy.exc import SAWarning
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.dialects.sqlite import DATE as SQLITE_DATE
-from sqlalchemy import create_engine
-
-from faker_sqlalchemy import SqlAlchemyProvider
-from tests.test_models import Base, Model, RelationshipModel, TypeOverrideModel
+from sqlalchemy import create_engine, event
+
+from faker_sqlalchemy import SqlAlchemyProvider, TableProfile, TemplateDatabase, profile_table
+from tests import test_models
+from tests.test_models import (
+    AssociationModel,
+    Base,
+    DeclarativeBase,
+    KeyedModel,
+    Model,
+    RelationshipModel,
+    TypeOverrideModel,
+    UniqueCodeModel,
+    UniqueCodeReferenceModel,
+)
 
 
 class _TestSessionFixture:
@@ -86,6 +103,11 @@ class AcceptanceTests(unittest.TestCase):
         self.faker: Union[SqlAlchemyProvider, Faker] = Faker()
         self.faker.add_provider(SqlAlchemyProvider)
 
+    def tearDown(self) -> None:
+        SqlAlchemyProvider.reset_column_mappings()
+
+        super().tearDown()
+
     def test_generates_models_for_model(self):
         model = self.faker.sqlalchemy_model(Model)
         self.assertIsInstance(model.big_integer, int)
@@ -139,3 +161,296 @@ class AcceptanceTests(unittest.TestCase):
 
         result = self.faker.sqlalchemy_model(TypeOverrideModel)
         self.assertEqual(result.sqlite_date, date)
+
+    def test_rows_can_be_seeded(self):
+        inserted = self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 5, RelationshipModel: 20})
+        self.assertEqual(inserted, {"model": 5, "relationship_model": 20})
+
+        with self.session_fixture as session:
+            model_ids = {model.id for model in session.query(Model)}
+            self.assertEqual(len(model_ids), 5)
+
+            relationship_models = session.query(RelationshipModel).all()
+            self.assertEqual(len(relationship_models), 20)
+            for relationship_model in relationship_models:
+                self.assertIn(relationship_model.model_id, model_ids)
+
+    def test_rows_can_be_inserted(self):
+        rows = self.faker.sqlalchemy_rows(Model, 25)
+        self.assertEqual(rows.insert(self.session_fixture.engine, batch_size=10), 25)
+
+        with self.session_fixture as session:
+            self.assertEqual(
+                sorted(model.string for model in session.query(Model)),
+                sorted(rows.column("string")),
+            )
+
+    def test_rows_can_be_exported_as_csv(self):
+        rows = self.faker.sqlalchemy_rows(Model, 3, generate_primary_keys=True)
+
+        output = io.StringIO(newline="")
+        rows.to_csv(output)
+
+        # Generated binary values are larger than the csv module's default field limit.
+        field_size_limit = csv.field_size_limit(4 * 1024 * 1024)
+        self.addCleanup(csv.field_size_limit, field_size_limit)
+        lines = list(csv.reader(io.StringIO(output.getvalue(), newline="")))
+        self.assertEqual(lines[0], rows.columns)
+        self.assertEqual([line[rows.index["string"]] for line in lines[1:]], rows.column("string"))
+        self.assertEqual(
+            [bytes.fromhex(line[rows.index["large_binary"]]) for line in lines[1:]],
+            rows.column("large_binary"),
+        )
+        self.assertEqual([json.loads(line[rows.index["json"]]) for line in lines[1:]], rows.column("json"))
+
+    def test_rows_are_exported_with_column_names(self):
+        rows = self.faker.sqlalchemy_rows(KeyedModel, 1)
+        self.assertEqual(rows.columns, ["username"])
+
+        output = io.StringIO(newline="")
+        rows.to_csv(output)
+        self.assertEqual(output.getvalue().splitlines()[0], "user_name")
+
+    def test_incremental_seeding_only_generates_missing_rows(self):
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 3})
+
+        inserted = self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 8}, incremental=True)
+        self.assertEqual(inserted, {"model": 5})
+
+        inserted = self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 8}, incremental=True)
+        self.assertEqual(inserted, {"model": 0})
+
+        with self.session_fixture as session:
+            self.assertEqual(session.query(Model).count(), 8)
+
+    def test_incremental_seeding_references_existing_rows(self):
+        with self.session_fixture as session:
+            session.add_all([self.faker.sqlalchemy_model(Model) for _ in range(3)])
+
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {RelationshipModel: 10}, incremental=True)
+
+        with self.session_fixture as session:
+            model_ids = {model.id for model in session.query(Model)}
+            self.assertEqual(len(model_ids), 3)
+            for relationship_model in session.query(RelationshipModel):
+                self.assertIn(relationship_model.model_id, model_ids)
+
+    def test_seeding_leaves_autoincrementing_keys_to_the_database(self):
+        inserted_columns = {}
+
+        def record_insert(conn, cursor, statement, parameters, context, executemany):
+            match = re.match(r"INSERT INTO (\w+) \(([^)]*)\)", statement)
+            if match:
+                inserted_columns.setdefault(match.group(1), set()).update(match.group(2).split(", "))
+
+        event.listen(self.session_fixture.engine, "before_cursor_execute", record_insert)
+        self.addCleanup(event.remove, self.session_fixture.engine, "before_cursor_execute", record_insert)
+
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 3, RelationshipModel: 10}, batch_size=4)
+
+        self.assertNotIn("id", inserted_columns["model"])
+        self.assertNotIn("id", inserted_columns["relationship_model"])
+        with self.session_fixture as session:
+            model_ids = {model.id for model in session.query(Model)}
+            for relationship_model in session.query(RelationshipModel):
+                self.assertIn(relationship_model.model_id, model_ids)
+
+    def test_association_tables_get_unique_keys(self):
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 3, RelationshipModel: 4, AssociationModel: 5})
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {AssociationModel: 7})
+
+        with self.session_fixture as session:
+            pairs = [(model.model_id, model.relationship_model_id) for model in session.query(AssociationModel)]
+            self.assertEqual(len(pairs), 12)
+            self.assertEqual(len(set(pairs)), 12)
+
+    def test_association_tables_cannot_have_more_rows_than_key_combinations(self):
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 2, RelationshipModel: 3})
+
+        with self.assertRaisesRegex(ValueError, "only allow 6 more unique combinations"):
+            self.faker.sqlalchemy_seed(self.session_fixture.engine, {AssociationModel: 7})
+
+    def test_seeding_inserts_a_batch_per_statement(self):
+        batches = []
+
+        def record_insert(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO relationship_model"):
+                batches.append(len(parameters) if executemany else 1)
+
+        event.listen(self.session_fixture.engine, "before_cursor_execute", record_insert)
+        self.addCleanup(event.remove, self.session_fixture.engine, "before_cursor_execute", record_insert)
+
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {RelationshipModel: 2500}, batch_size=2000)
+
+        self.assertEqual(sum(batches), 2500)
+        self.assertEqual(len(batches), 2)
+
+    def test_columns_with_keys_other_than_their_names_can_be_seeded(self):
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 2, KeyedModel: 5})
+        rows = self.faker.sqlalchemy_rows(KeyedModel, 3, model_id=None)
+        self.assertEqual(rows.columns, ["model_id", "username"])
+        rows.insert(self.session_fixture.engine)
+
+        with self.session_fixture as session:
+            model_ids = {model.id for model in session.query(Model)}
+            keyed_models = session.query(KeyedModel).all()
+            self.assertEqual(len(keyed_models), 8)
+            self.assertTrue(all(isinstance(model.username, str) for model in keyed_models))
+            self.assertEqual(sum(model.model_id in model_ids for model in keyed_models), 5)
+
+    def test_seeding_never_references_null_keys(self):
+        with self.session_fixture as session:
+            session.add_all([UniqueCodeModel(code=code) for code in (None, 1, None, 2, None)])
+
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {UniqueCodeReferenceModel: 20})
+
+        with self.session_fixture as session:
+            codes = {model.code for model in session.query(UniqueCodeReferenceModel)}
+            self.assertTrue(codes)
+            self.assertLessEqual(codes, {1, 2})
+
+    @unittest.skipIf(DeclarativeBase is None, "Requires SQLAlchemy 2.0")
+    def test_2_0_models_can_be_seeded(self):
+        metadata = test_models.Base20.metadata
+        metadata.create_all(self.session_fixture.engine)
+        self.addCleanup(metadata.drop_all, self.session_fixture.engine)
+
+        self.faker.sqlalchemy_seed(
+            self.session_fixture.engine,
+            {test_models.DataclassModel: 5, test_models.DataclassRelationshipModel: 30},
+            batch_size=7,
+        )
+
+        with self.session_fixture as session:
+            model_ids = {model.id for model in session.query(test_models.DataclassModel)}
+            self.assertEqual(len(model_ids), 5)
+
+            relationship_models = session.query(test_models.DataclassRelationshipModel).all()
+            relationship_ids = {model.id for model in relationship_models}
+            self.assertEqual(len(relationship_ids), 30)
+            for relationship_model in relationship_models:
+                self.assertIn(relationship_model.model_id, model_ids)
+                self.assertIn(relationship_model.parent_id, relationship_ids | {None})
+            self.assertNotEqual({model.parent_id for model in relationship_models}, {None})
+
+    def test_tables_can_be_profiled(self):
+        with self.session_fixture as session:
+            for index in range(50):
+                session.add(self.faker.sqlalchemy_model(
+                    Model, small_integer=index % 5, string=None if index % 2 else "x" * index
+                ))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "model.json")
+            profile_table(self.session_fixture.engine, Model, sample_size=20, seed=0).save(path)
+            profile = TableProfile.load(path)
+
+        self.assertEqual(profile.table, "model")
+        self.assertEqual(profile.rows, 50)
+        self.assertNotIn("id", profile.columns)
+        self.assertEqual(profile.columns["small_integer"].kind, "categorical")
+        self.assertEqual(profile.columns["date"].kind, "date")
+        self.assertEqual(profile.columns["datetime"].kind, "datetime")
+
+        SqlAlchemyProvider.register_profile(profile)
+        self.faker.sqlalchemy_seed(self.session_fixture.engine, {Model: 100})
+
+        with self.session_fixture as session:
+            models = session.query(Model).all()
+            self.assertTrue(all(model.small_integer in range(5) for model in models))
+            self.assertIn(None, {model.string for model in models[50:]})
+
+
+class TemplateDatabaseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        SqlAlchemyProvider.reset_type_mappings()
+
+        super().setUp()
+
+        self._ctx = warnings.catch_warnings()
+        self._ctx.__enter__()
+        warnings.simplefilter("ignore", category=SAWarning)
+
+        self.faker: Union[SqlAlchemyProvider, Faker] = Faker()
+        self.faker.add_provider(SqlAlchemyProvider)
+
+        self.populate_calls = 0
+        self.template = TemplateDatabase(Base.metadata, self._populate)
+
+    def tearDown(self) -> None:
+        self.template.close()
+        self._ctx.__exit__()
+
+        super().tearDown()
+
+    def _populate(self, session):
+        self.populate_calls += 1
+        session.add_all([self.faker.sqlalchemy_model(Model) for _ in range(10)])
+
+    def test_clones_contain_the_seeded_data(self):
+        self.assertEqual(self._count_in(self.template.clone()), 10)
+
+    def test_template_is_only_populated_once(self):
+        for _ in range(3):
+            self.template.clone().dispose()
+
+        self.assertEqual(self.populate_calls, 1)
+
+    def test_clones_are_isolated_from_each_other(self):
+        first = self.template.clone()
+        second = self.template.clone()
+
+        session = sessionmaker(bind=first)()
+        try:
+            session.query(Model).delete()
+            session.commit()
+        finally:
+            session.close()
+            first.dispose()
+
+        self.assertEqual(self._count_in(second), 10)
+        self.assertEqual(self._count_in(self.template.clone()), 10)
+
+    def test_failed_population_releases_the_template(self):
+        def fail(session):
+            raise RuntimeError("populate failed")
+
+        connections = []
+        connect = sqlite3.connect
+
+        def record_connect(*args, **kwargs):
+            connections.append(connect(*args, **kwargs))
+            return connections[-1]
+
+        template = TemplateDatabase(Base.metadata, fail)
+        with mock.patch("sqlite3.connect", record_connect), self.assertRaises(RuntimeError):
+            template.clone()
+
+        self.assertEqual(len(connections), 1)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+
+    def test_closing_releases_the_template(self):
+        self.template.clone().dispose()
+        connection = self.template._connection
+
+        self.template.close()
+
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+    def test_clones_may_be_written_to_a_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clone.sqlite3")
+            self.template.clone(path).dispose()
+
+            self.assertEqual(self._count_in(create_engine(f"sqlite:///{path}")), 10)
+
+    @staticmethod
+    def _count_in(engine):
+        session = sessionmaker(bind=engine)()
+        try:
+            return session.query(Model).count()
+        finally:
+            session.close()
+            engine.dispose()
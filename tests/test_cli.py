@@ -0,0 +1,110 @@
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
+import os.path
+import sqlite3
+import tempfile
+import unittest
+import warnings
+
+from sqlalchemy.exc import SAWarning
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+from faker_sqlalchemy import main, _initialize_worker, _worker_batches
+
+schema_metadata = MetaData()
+schema_table = Table(
+    "schema_model",
+    schema_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("value", String),
+    schema="other",
+)
+
+
+class CommandLineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self._ctx = warnings.catch_warnings()
+        self._ctx.__enter__()
+        warnings.simplefilter("ignore", category=SAWarning)
+
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._temp_dir.name, "db.sqlite3")
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        self._ctx.__exit__()
+
+        super().tearDown()
+
+    def _seed(self, *arguments):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            status = main([
+                "seed", "tests.test_models:Base", "--url", f"sqlite:///{self.path}", "--create-tables", *arguments
+            ])
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def _count(self, table):
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_seed_inserts_rows_and_prints_a_summary(self):
+        status, stdout, stderr = self._seed("--rows", "model=2", "relationship_model=1e2", "--seed", "42")
+
+        self.assertEqual(status, 0)
+        self.assertEqual(self._count("model"), 2)
+        self.assertEqual(self._count("relationship_model"), 100)
+        self.assertIn("relationship_model: 100/100 rows (100%)", stderr)
+        self.assertIn("peak memory", stdout)
+        self.assertRegex(stdout, r"total\s+102 ")
+
+    def test_seed_may_use_worker_processes(self):
+        status, _, _ = self._seed("--rows", "relationship_model=50", "--workers", "2", "--batch-size", "10")
+
+        self.assertEqual(status, 0)
+        self.assertEqual(self._count("relationship_model"), 50)
+
+    def test_seed_may_top_up_tables(self):
+        self._seed("--rows", "relationship_model=10")
+        self._seed("--rows", "relationship_model=25", "--incremental")
+
+        self.assertEqual(self._count("relationship_model"), 25)
+
+    def test_unknown_tables_are_rejected(self):
+        with self.assertRaises(SystemExit) as context:
+            self._seed("--rows", "unknown=1")
+        self.assertEqual(context.exception.code, 2)
+
+    def test_invalid_arguments_are_rejected(self):
+        for arguments in (
+            ["--rows", "model=inf"],
+            ["--rows", "model=-1"],
+            ["--rows", "model=1", "--workers", "0"],
+            ["--rows", "model=1", "--batch-size", "0"],
+        ):
+            with self.subTest(arguments=arguments), self.assertRaises(SystemExit) as context:
+                self._seed(*arguments)
+            self.assertEqual(context.exception.code, 2)
+
+    def test_database_errors_are_reported(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+            main(["seed", "tests.test_models:Base", "--url", f"sqlite:///{self.path}", "--rows", "model=1"])
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn("no such table", stderr.getvalue())
+
+    def test_workers_find_schema_qualified_tables(self):
+        pool = ProcessPoolExecutor(1, initializer=_initialize_worker, initargs=("tests.test_cli:schema_metadata",))
+        with pool:
+            batches = _worker_batches(pool, 1, 42, {})
+            rows = [row for batch in batches(schema_table, [schema_table.c.value], 5, 2) for row in batch]
+
+        self.assertEqual(len(rows), 5)
+        self.assertTrue(all(isinstance(value, str) for value, in rows))
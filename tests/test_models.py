@@ -1,6 +1,13 @@
+from typing import List, Optional
+
 from sqlalchemy.ext.declarative import declarative_base
 
 from sqlalchemy.orm import relationship
+try:
+    from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
+except ImportError:
+    # SA < 2.0
+    DeclarativeBase = None
 from sqlalchemy.dialects.sqlite import DATE as SQLITE_DATE
 from sqlalchemy import (
     Column,
@@ -56,6 +63,10 @@ __all__ = (
     "Model",
     "RelationshipModel",
     "TypeOverrideModel",
+    "UniqueCodeModel",
+    "UniqueCodeReferenceModel",
+    "AssociationModel",
+    "KeyedModel",
 )
 
 
@@ -101,3 +112,90 @@ class TypeOverrideModel(Base):
     id = Column(Integer, primary_key=True)
 
     sqlite_date = Column(SQLITE_DATE)
+
+
+class UniqueCodeModel(Base):
+    __tablename__ = "unique_code_model"
+
+    id = Column(Integer, primary_key=True)
+
+    code = Column(Integer, unique=True, nullable=True)
+
+
+class UniqueCodeReferenceModel(Base):
+    __tablename__ = "unique_code_reference_model"
+
+    id = Column(Integer, primary_key=True)
+    code = Column(Integer, ForeignKey("unique_code_model.code"), nullable=False)
+
+
+class AssociationModel(Base):
+    __tablename__ = "association_model"
+
+    model_id = Column(Integer, ForeignKey("model.id"), primary_key=True)
+    relationship_model_id = Column(Integer, ForeignKey("relationship_model.id"), primary_key=True)
+
+
+class KeyedModel(Base):
+    __tablename__ = "keyed_model"
+
+    id = Column(Integer, primary_key=True)
+    model_id = Column("model_fk", Integer, ForeignKey("model.id"), key="model_id")
+
+    username = Column("user_name", String, key="username")
+
+
+if DeclarativeBase is not None:
+    __all__ += (
+        "Base20",
+        "MappedModel",
+        "DataclassModel",
+        "DataclassRelationshipModel",
+        "DataclassParentModel",
+        "DataclassChildModel",
+    )
+
+    class Base20(DeclarativeBase):
+        pass
+
+    class MappedModel(Base20):
+        __tablename__ = "mapped_model"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+        string: Mapped[str] = mapped_column(String)
+        integer: Mapped[Optional[int]]
+
+    class DataclassModel(MappedAsDataclass, Base20):
+        __tablename__ = "dataclass_model"
+
+        id: Mapped[int] = mapped_column(primary_key=True, init=False)
+
+        string: Mapped[str] = mapped_column(String)
+        integer: Mapped[int] = mapped_column(default=0)
+
+    class DataclassRelationshipModel(MappedAsDataclass, Base20):
+        __tablename__ = "dataclass_relationship_model"
+
+        id: Mapped[int] = mapped_column(primary_key=True, init=False)
+        model_id: Mapped[Optional[int]] = mapped_column(ForeignKey("dataclass_model.id"))
+        parent_id: Mapped[Optional[int]] = mapped_column(ForeignKey("dataclass_relationship_model.id"))
+
+        value: Mapped[str] = mapped_column(String)
+
+        model: Mapped[Optional[DataclassModel]] = relationship()
+
+    class DataclassParentModel(MappedAsDataclass, Base20):
+        __tablename__ = "dataclass_parent_model"
+
+        id: Mapped[int] = mapped_column(primary_key=True, init=False)
+
+        children: Mapped[List["DataclassChildModel"]] = relationship(back_populates="parent")
+
+    class DataclassChildModel(MappedAsDataclass, Base20):
+        __tablename__ = "dataclass_child_model"
+
+        id: Mapped[int] = mapped_column(primary_key=True, init=False)
+        parent_id: Mapped[Optional[int]] = mapped_column(ForeignKey("dataclass_parent_model.id"))
+
+        parent: Mapped[Optional[DataclassParentModel]] = relationship(back_populates="children")
@@ -3,8 +3,9 @@ from typing import Union
 
 from faker import Faker
 
-from faker_sqlalchemy import SqlAlchemyProvider
-from tests.test_models import Model, RelationshipModel
+from faker_sqlalchemy import SqlAlchemyProvider, ColumnProfile
+from tests import test_models
+from tests.test_models import DeclarativeBase, Model, RelationshipModel
 
 
 class SqlAlchemyProviderTests(unittest.TestCase):
@@ -16,6 +17,11 @@ class SqlAlchemyProviderTests(unittest.TestCase):
         self.faker: Union[SqlAlchemyProvider, Faker] = Faker()
         self.faker.add_provider(SqlAlchemyProvider)
 
+    def tearDown(self) -> None:
+        SqlAlchemyProvider.reset_column_mappings()
+
+        super().tearDown()
+
     def test_primary_key_fields_are_not_generated_by_default(self):
         result = self.faker.sqlalchemy_model(Model)
         self.assertIsNone(result.id)
@@ -44,3 +50,91 @@ class SqlAlchemyProviderTests(unittest.TestCase):
         result = self.faker.sqlalchemy_model(RelationshipModel, generate_related=True, generate_primary_keys=True)
         self.assertIsNotNone(result.model_id)
         self.assertEqual(result.model_id, result.model.id)
+
+    @unittest.skipIf(DeclarativeBase is None, "Requires SQLAlchemy 2.0")
+    def test_2_0_mapped_models_may_be_generated(self):
+        result = self.faker.sqlalchemy_model(test_models.MappedModel)
+        self.assertIsInstance(result.string, str)
+        self.assertIsInstance(result.integer, int)
+        self.assertIsNone(result.id)
+
+    @unittest.skipIf(DeclarativeBase is None, "Requires SQLAlchemy 2.0")
+    def test_dataclass_models_may_be_generated(self):
+        result = self.faker.sqlalchemy_model(test_models.DataclassModel, generate_primary_keys=True)
+        self.assertIsInstance(result.string, str)
+        self.assertIsInstance(result.id, int)
+
+        result = self.faker.sqlalchemy_model(test_models.DataclassRelationshipModel, generate_related=True)
+        self.assertIsInstance(result.model, test_models.DataclassModel)
+        self.assertIsNone(result.model_id)
+
+    @unittest.skipIf(DeclarativeBase is None, "Requires SQLAlchemy 2.0")
+    def test_dataclass_models_with_collections_may_be_generated(self):
+        parent = self.faker.sqlalchemy_model(test_models.DataclassParentModel)
+        self.assertEqual(parent.children, [])
+
+        child = self.faker.sqlalchemy_model(test_models.DataclassChildModel)
+        self.assertIsNone(child.parent)
+
+    def test_unmapped_classes_are_rejected(self):
+        with self.assertRaises(AssertionError):
+            self.faker.sqlalchemy_model(object)
+
+    def test_rows_may_be_generated(self):
+        rows = self.faker.sqlalchemy_rows(Model, 5, string="override")
+        self.assertEqual(len(rows), 5)
+        self.assertNotIn("id", rows.columns)
+        self.assertEqual(rows.column("string"), ["override"] * 5)
+        self.assertTrue(all(isinstance(row, tuple) for row in rows))
+
+    def test_rows_exclude_foreign_keys_unless_overridden(self):
+        self.assertNotIn("model_id", self.faker.sqlalchemy_rows(RelationshipModel, 1).columns)
+
+        rows = self.faker.sqlalchemy_rows(RelationshipModel, 1, model_id=1)
+        self.assertEqual(rows[0][rows.index["model_id"]], 1)
+
+    def test_columns_may_be_mapped(self):
+        SqlAlchemyProvider.register_column_mapping("model.string", lambda generator, column: "mapped")
+        result = self.faker.sqlalchemy_model(Model)
+        self.assertEqual(result.string, "mapped")
+        self.assertNotEqual(result.unicode, "mapped")
+
+    def test_categorical_profiles_generate_observed_values(self):
+        profile = ColumnProfile.from_values(["a"] * 90 + ["b"] * 10)
+        self.assertEqual(profile.kind, "categorical")
+        self.assertEqual(profile.distinct, 2)
+
+        values = [profile(self.faker, None) for _ in range(1000)]
+        self.assertEqual(set(values), {"a", "b"})
+        self.assertGreater(values.count("a"), values.count("b"))
+
+    def test_profiles_generate_nulls_at_the_observed_rate(self):
+        profile = ColumnProfile.from_values([None] * 50 + list(range(50)), max_categories=10)
+        self.assertEqual(profile.kind, "integer")
+        self.assertEqual(profile.null_rate, 0.5)
+
+        values = [profile(self.faker, None) for _ in range(1000)]
+        self.assertTrue(250 < values.count(None) < 750)
+        self.assertTrue(all(0 <= value <= 49 for value in values if value is not None))
+
+    def test_string_profiles_generate_observed_lengths(self):
+        profile = ColumnProfile.from_values([str(value) * 3 for value in range(1000)], max_categories=10)
+        self.assertEqual(profile.kind, "string")
+
+        for _ in range(100):
+            self.assertIn(len(profile(self.faker, None)), (3, 6, 9))
+
+    def test_profiles_generate_the_observed_ratio_of_distinct_values(self):
+        strings = ColumnProfile.from_values([str(value) * 3 for value in range(200)] * 10, max_categories=10)
+        integers = ColumnProfile.from_values(list(range(0, 10 ** 6, 5000)) * 10, max_categories=10)
+
+        for profile in (strings, integers):
+            self.assertEqual(profile.distinct, 200)
+            values = [profile(self.faker, None) for _ in range(2000)]
+            self.assertTrue(100 < len(set(values)) < 300)
+
+    def test_profiles_of_unique_values_generate_distinct_values(self):
+        profile = ColumnProfile.from_values([str(value) * 3 for value in range(1000)], max_categories=10)
+
+        values = [profile(self.faker, None) for _ in range(1000)]
+        self.assertGreater(len(set(values)), 900)